@@ -5,13 +5,25 @@ Windows-only tools for reading terminal keyboard input (some wrapped functions f
 
 # IMPORTS
 
+from types import MappingProxyType
+from enum import IntEnum
+from typing import Callable, Iterator, Any
+import collections
+import threading
 import platform
+import time
 
 if platform.system() != 'Windows':
     raise OSError('The soup_tui.keyboard module only supports the Windows operating system!')
 
+from ctypes import wintypes
+import ctypes
 import msvcrt
 
+_kbhit: Callable[[], int] = msvcrt.kbhit
+_getwch: Callable[[], str] = msvcrt.getwch
+_getch: Callable[[], bytes] = msvcrt.getch
+
 # KEY CODES
 
 SPACE: str       = ' '
@@ -68,32 +80,394 @@ CTRL_DOWN_ARROW: str = '\xe0\x91'
 CTRL_LEFT_ARROW: str = '\xe0s'
 CTRL_RIGHT_ARROW: str = '\xe0t'
 
+# The name of each key code above, e.g. ``KEY_NAMES[UP_ARROW] == 'UP_ARROW'`` (the first name is used for shared key codes)
+KEY_NAMES: MappingProxyType[str, str] = MappingProxyType({
+    value: name for name, value in reversed(globals().items()) if name.isupper() and isinstance(value, str)
+})
+
+class KEYS_BYTES:
+    """
+    Class of every key code above as bytes, for comparing with keys read by ``read_key_bytes()``.
+    """
+
+for _name, _key in tuple(globals().items()):
+    if _name.isupper() and isinstance(_key, str):
+        setattr(KEYS_BYTES, _name, _key.encode('latin-1'))
+del _name, _key
+
+# An integer ID for each distinct key code above (shared key codes share an ID), see ``classify()``
+_KEY_IDS: dict[str, int] = {
+    key: key_id for key_id, key in enumerate(dict.fromkeys(
+        value for name, value in globals().items() if name.isupper() and isinstance(value, str)
+    ))
+}
+Key: type[IntEnum] = IntEnum('Key', [
+    (name, _KEY_IDS[value]) for name, value in globals().items() if name.isupper() and isinstance(value, str)
+])
+
+# CONSOLE API
+
+_STD_INPUT_HANDLE: int = -10
+_INFINITE: int = 0xFFFFFFFF
+_WAIT_OBJECT_0: int = 0x00000000
+_FALLBACK_POLL_INTERVAL: float = 0.01 # seconds between checks when waiting with a timeout for a keypress on a non-console stdin
+_KEY_EVENT: int = 0x0001
+_FOCUS_EVENT: int = 0x0010
+_ESC_PREFIXES: str = '\x00\xe0' # first characters of special function keys from msvcrt.getwch()
+_ESC_PREFIXES_BYTES: bytes = b'\x00\xe0'
+_RIGHT_ALT_PRESSED: int = 0x0001
+_LEFT_ALT_PRESSED: int = 0x0002
+_RIGHT_CTRL_PRESSED: int = 0x0004
+_LEFT_CTRL_PRESSED: int = 0x0008
+_SHIFT_PRESSED: int = 0x0010
+_ENHANCED_KEY: int = 0x0100
+_VK_MENU: int = 0x12 # the ALT key, whose release carries the character typed with ALT+numpad
+
+# Special keys (which have no unicode character) by scan code, encoded the same way msvcrt.getwch() encodes them
+# Each entry holds the key code with no modifier, SHIFT, CTRL and ALT held, or None where msvcrt.getwch() skips the key
+_KeyEscapes = tuple[str | None, str | None, str | None, str | None]
+_ENHANCED_KEY_ESCAPES: dict[int, _KeyEscapes] = { # the gray keys, which are flagged as enhanced
+    28: (None, None, None, '\x00\xa6'), # numpad ENTER
+    53: (None, None, '\x00\x95', '\x00\xa4'), # numpad /
+    71: ('\xe0G', '\xe0G', '\xe0w', '\x00\x97'), # HOME
+    72: (UP_ARROW, UP_ARROW, CTRL_UP_ARROW, '\x00\x98'),
+    73: ('\xe0I', '\xe0I', '\xe0\x84', '\x00\x99'), # PAGE UP
+    75: (LEFT_ARROW, LEFT_ARROW, CTRL_LEFT_ARROW, '\x00\x9b'),
+    77: (RIGHT_ARROW, RIGHT_ARROW, CTRL_RIGHT_ARROW, '\x00\x9d'),
+    79: ('\xe0O', '\xe0O', '\xe0u', '\x00\x9f'), # END
+    80: (DOWN_ARROW, DOWN_ARROW, CTRL_DOWN_ARROW, '\x00\xa0'),
+    81: ('\xe0Q', '\xe0Q', '\xe0v', '\x00\xa1'), # PAGE DOWN
+    82: ('\xe0R', '\xe0R', '\xe0\x92', '\x00\xa2'), # INSERT
+    83: ('\xe0S', '\xe0S', '\xe0\x93', '\x00\xa3'), # DELETE
+}
+_NORMAL_KEY_ESCAPES: dict[int, _KeyEscapes] = {
+    # ALT with a number row key gives codes starting at 120, and ALT with a letter or symbol key gives its scan code
+    **{scan_code: (None, None, None, f'\x00{chr(scan_code + 118)}') for scan_code in range(2, 14)},
+    **{scan_code: (None, None, None, f'\x00{chr(scan_code)}') for scan_code in (*range(16, 28), *range(30, 42), 43, *range(44, 54))},
+    # F1 to F10
+    **{scan_code: tuple(f'\x00{chr(scan_code + offset)}' for offset in (0, 25, 35, 45)) for scan_code in range(59, 69)},
+    1: (None, None, None, '\x00\x01'), # ESCAPE
+    3: (None, None, CTRL_2, '\x00y'),
+    14: (None, None, None, '\x00\x0e'), # BACKSPACE
+    15: (None, '\x00\x0f', '\x00\x94', '\x00\x0f'), # TAB
+    28: (None, None, None, '\x00\x1c'), # ENTER
+    # numpad keys while NUM LOCK is off
+    71: ('\x00G', None, '\x00w', None),
+    72: ('\x00H', None, '\x00\x8d', None),
+    73: ('\x00I', None, '\x00\x84', None),
+    74: (None, None, '\x00\x8e', '\x00J'),
+    75: ('\x00K', None, '\x00s', None),
+    76: (None, None, '\x00\x8f', None),
+    77: ('\x00M', None, '\x00t', None),
+    78: (None, None, '\x00\x90', '\x00N'),
+    79: ('\x00O', None, '\x00u', None),
+    80: ('\x00P', None, '\x00\x91', None),
+    81: ('\x00Q', None, '\x00v', None),
+    82: ('\x00R', None, '\x00\x92', None),
+    83: ('\x00S', None, '\x00\x93', None),
+    87: ('\xe0\x85', '\xe0\x87', '\xe0\x89', '\xe0\x8b'), # F11
+    88: (F12, '\xe0\x88', '\xe0\x8a', '\xe0\x8c'),
+}
+
+class _CHAR_UNION(ctypes.Union):
+    _fields_ = [('UnicodeChar', wintypes.WCHAR), ('AsciiChar', wintypes.CHAR)]
+
+class _KEY_EVENT_RECORD(ctypes.Structure):
+    _fields_ = [('bKeyDown', wintypes.BOOL),
+                ('wRepeatCount', wintypes.WORD),
+                ('wVirtualKeyCode', wintypes.WORD),
+                ('wVirtualScanCode', wintypes.WORD),
+                ('uChar', _CHAR_UNION),
+                ('dwControlKeyState', wintypes.DWORD)]
+
+class _EVENT_UNION(ctypes.Union):
+    # Every other event record (mouse, buffer size, menu, focus) is no larger than a key event record
+    _fields_ = [('KeyEvent', _KEY_EVENT_RECORD)]
+
+class _INPUT_RECORD(ctypes.Structure):
+    _fields_ = [('EventType', wintypes.WORD), ('Event', _EVENT_UNION)]
+
+# Input records are always read into this one buffer, except by the listener thread which has its own
+_INPUT_BUFFER_SIZE: int = 256
+_input_buffer: ctypes.Array = (_INPUT_RECORD * _INPUT_BUFFER_SIZE)()
+_DRAIN_BATCH_SIZE: int = 16 # number of records to look at each time when throwing away records that aren't keypresses
+_key_handlers: dict[str, Callable[[str], Any]] = {} # handlers set by bind()
+_pending_keys: list[str] = [] # repeats of the last key read by read_key() that haven't been returned yet
+
+_listener_keys: collections.deque[str] = collections.deque() # keys read by the listener thread that haven't been returned yet
+_listener_key_ready: threading.Event = threading.Event()
+_listener_thread: threading.Thread | None = None
+_listener_stopping: bool = False
+
+_kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+_kernel32.GetStdHandle.argtypes = (wintypes.DWORD,)
+_kernel32.GetStdHandle.restype = wintypes.HANDLE
+_kernel32.GetConsoleMode.argtypes = (wintypes.HANDLE, wintypes.LPDWORD)
+_kernel32.GetConsoleMode.restype = wintypes.BOOL
+_kernel32.WaitForSingleObject.argtypes = (wintypes.HANDLE, wintypes.DWORD)
+_kernel32.WaitForSingleObject.restype = wintypes.DWORD
+_kernel32.PeekConsoleInputW.argtypes = (wintypes.HANDLE, ctypes.POINTER(_INPUT_RECORD), wintypes.DWORD, wintypes.LPDWORD)
+_kernel32.PeekConsoleInputW.restype = wintypes.BOOL
+_kernel32.ReadConsoleInputW.argtypes = (wintypes.HANDLE, ctypes.POINTER(_INPUT_RECORD), wintypes.DWORD, wintypes.LPDWORD)
+_kernel32.ReadConsoleInputW.restype = wintypes.BOOL
+_kernel32.GetNumberOfConsoleInputEvents.argtypes = (wintypes.HANDLE, wintypes.LPDWORD)
+_kernel32.GetNumberOfConsoleInputEvents.restype = wintypes.BOOL
+_kernel32.WriteConsoleInputW.argtypes = (wintypes.HANDLE, ctypes.POINTER(_INPUT_RECORD), wintypes.DWORD, wintypes.LPDWORD)
+_kernel32.WriteConsoleInputW.restype = wintypes.BOOL
+
+_STDIN_HANDLE: int | None = _kernel32.GetStdHandle(_STD_INPUT_HANDLE)
+
+# Only wait on the input handle if it is actually a console (it could also be invalid, or a redirected file or pipe)
+_console_input: bool = _STDIN_HANDLE not in (None, ctypes.c_void_p(-1).value) and _kernel32.GetConsoleMode(_STDIN_HANDLE, ctypes.byref(wintypes.DWORD())) != 0
+
 # DEFINITIONS
 
-def read_key(blocking: bool = True) -> str | None:
+def _decode_key_press(record: _INPUT_RECORD) -> str | None:
+    # Returns the key the same way msvcrt.getwch() would, or None if msvcrt.getwch() would skip the record
+    if record.EventType != _KEY_EVENT:
+        return None
+    key_event: _KEY_EVENT_RECORD = record.Event.KeyEvent
+    if not key_event.bKeyDown:
+        # Releasing ALT after typing a character code on the numpad delivers that character
+        if key_event.wVirtualKeyCode == _VK_MENU and (char := key_event.uChar.UnicodeChar) != '\x00':
+            return char
+        return None
+    if (char := key_event.uChar.UnicodeChar) != '\x00':
+        return char
+
+    # Look the key up by scan code like the C runtime does, with ALT taking priority over CTRL, then SHIFT
+    control_key_state: int = key_event.dwControlKeyState
+    escapes: _KeyEscapes | None = (_ENHANCED_KEY_ESCAPES if control_key_state & _ENHANCED_KEY else _NORMAL_KEY_ESCAPES).get(key_event.wVirtualScanCode)
+    if escapes is None:
+        return None
+    if control_key_state & (_LEFT_ALT_PRESSED | _RIGHT_ALT_PRESSED):
+        return escapes[3]
+    if control_key_state & (_LEFT_CTRL_PRESSED | _RIGHT_CTRL_PRESSED):
+        return escapes[2]
+    if control_key_state & _SHIFT_PRESSED:
+        return escapes[1]
+    return escapes[0]
+
+def _is_key_press(record: _INPUT_RECORD) -> bool:
+    return _decode_key_press(record) is not None
+
+def _drain_non_key_events() -> bool:
+    # Removes every record in front of the first keypress from the input queue; returns True if a keypress is queued
+    count: wintypes.DWORD = wintypes.DWORD()
+    while True:
+        if not _kernel32.PeekConsoleInputW(_STDIN_HANDLE, _input_buffer, _DRAIN_BATCH_SIZE, ctypes.byref(count)):
+            return False
+        num_peeked: int = count.value
+        num_non_key: int = 0
+        while num_non_key < num_peeked and not _is_key_press(_input_buffer[num_non_key]):
+            num_non_key += 1
+
+        if num_non_key > 0:
+            _kernel32.ReadConsoleInputW(_STDIN_HANDLE, _input_buffer, num_non_key, ctypes.byref(count))
+        if num_non_key < num_peeked:
+            return True
+        if num_peeked < _DRAIN_BATCH_SIZE:
+            return False
+
+def _has_key() -> bool:
+    # Unlike msvcrt.kbhit(), only counts keypresses (mouse, focus, resize and key release records are thrown away)
+    if not _console_input:
+        return _kbhit() != 0
+    return _drain_non_key_events()
+
+def _wait_key(timeout_ms: int) -> bool:
+    # Waits at the OS level until a keypress is at the front of the input queue; returns False on timeout
+    deadline: float | None = None
+    if 0 < timeout_ms < _INFINITE:
+        deadline = time.perf_counter() + timeout_ms / 1000
+
+    while True:
+        if _kernel32.WaitForSingleObject(_STDIN_HANDLE, timeout_ms) != _WAIT_OBJECT_0:
+            return False
+
+        # The handle is signaled by any input record (mouse, focus, resize, key release), so throw those away first
+        if _drain_non_key_events():
+            return True
+
+        # Only wait for what is left of the timeout
+        if deadline is not None:
+            timeout_ms = max(0, round((deadline - time.perf_counter()) * 1000))
+
+def _read_console_key(timeout_ms: int) -> str | None:
+    # Reads one keypress straight from its input record, so special keys take a single read instead of two getwch() calls
+    if _pending_keys:
+        return _pending_keys.pop()
+    if not _wait_key(timeout_ms):
+        return None
+
+    count: wintypes.DWORD = wintypes.DWORD()
+    _kernel32.ReadConsoleInputW(_STDIN_HANDLE, _input_buffer, 1, ctypes.byref(count))
+    key_record: _INPUT_RECORD = _input_buffer[0]
+    key: str = _decode_key_press(key_record)
+
+    # A held key can be reported as one record with a repeat count
+    _pending_keys.extend([key] * (key_record.Event.KeyEvent.wRepeatCount - 1))
+    return key
+
+def _read_msvcrt_key() -> str:
+    # Grab the key that was pressed
+    first_key: str = _getwch()
+
+    # Return the key, unless it is an escape code that signifies a special function key
+    if first_key not in _ESC_PREFIXES:
+        return first_key
+
+    # If it was a special function key, read the second part and return the full code
+    second_key: str = _getwch()
+    return first_key + second_key
+
+def _pump_keys() -> None:
+    # Runs in the listener thread; moves every keypress from the console input queue into _listener_keys
+    records: ctypes.Array = (_INPUT_RECORD * _INPUT_BUFFER_SIZE)()
+    count: wintypes.DWORD = wintypes.DWORD()
+    while not _listener_stopping:
+        if _kernel32.WaitForSingleObject(_STDIN_HANDLE, _INFINITE) != _WAIT_OBJECT_0:
+            break
+        if not _kernel32.ReadConsoleInputW(_STDIN_HANDLE, records, _INPUT_BUFFER_SIZE, ctypes.byref(count)):
+            break
+
+        for record in records[:count.value]:
+            if (key := _decode_key_press(record)) is not None:
+                _listener_keys.extend([key] * max(record.Event.KeyEvent.wRepeatCount, 1))
+        if _listener_keys:
+            _listener_key_ready.set()
+
+def _read_listener_key(blocking: bool, timeout: float | None) -> str | None:
+    deadline: float | None = None if timeout is None else time.perf_counter() + timeout
+    while True:
+        if _listener_keys:
+            return _listener_keys.popleft()
+        if not blocking:
+            return None
+
+        # Clear first and check again, so a key queued in between isn't missed
+        _listener_key_ready.clear()
+        if _listener_keys:
+            continue
+        remaining: float | None = None if deadline is None else max(0.0, deadline - time.perf_counter())
+        if _listener_thread is None:
+            return read_key(blocking, remaining)
+        if remaining == 0:
+            return None
+        _listener_key_ready.wait(remaining)
+
+def start_listener() -> None:
+    """
+    Starts a background thread that reads keypresses as soon as they happen.
+
+    While the listener is running, ``read_key()`` and ``dump_cache()`` take keys from the listener's queue instead of
+    reading the console themselves, which is much cheaper for programs that check for keys many times per second.
+
+    :rtype: None
+    """
+    global _listener_thread
+    global _listener_stopping
+
+    if not _console_input:
+        raise OSError('Attempted to start the key listener, but the standard input is not a console!')
+    if _listener_thread is not None:
+        return
+
+    _listener_stopping = False
+    _listener_thread = threading.Thread(target=_pump_keys, name='soup_tui.keyboard listener', daemon=True)
+    _listener_thread.start()
+
+def stop_listener() -> None:
+    """
+    Stops the background thread started by ``start_listener()``. Keys it already read can still be read afterwards.
+
+    :rtype: None
+    """
+    global _listener_thread
+    global _listener_stopping
+
+    if _listener_thread is None:
+        return
+
+    # Wake the listener up with a harmless focus event so that it notices it should stop
+    _listener_stopping = True
+    wake_record: _INPUT_RECORD = _INPUT_RECORD()
+    wake_record.EventType = _FOCUS_EVENT
+    _kernel32.WriteConsoleInputW(_STDIN_HANDLE, ctypes.byref(wake_record), 1, ctypes.byref(wintypes.DWORD()))
+    _listener_thread.join()
+    _listener_thread = None
+
+    # Wake up any read_key() call waiting on the listener
+    _listener_key_ready.set()
+
+def read_key(blocking: bool = True, timeout: float | None = None) -> str | None:
     """
     Reads one keypress.
+    For the fastest reads in a loop, use ``read_key_blocking()`` or ``try_read_key()`` instead.
 
     :param blocking: If enabled, waits for a keypress. Otherwise, checks if a key was pressed.
     :type blocking: bool
-    :return: The pressed key as a 1 or 2-character string. 2-character strings represent special function keys. If blocking is disabled and no key was read, returns ``None`` instead.
+    :param timeout: If blocking is enabled, the maximum number of seconds to wait for a keypress, or None to wait forever.
+    :type timeout: float | None
+    :return: The pressed key as a 1 or 2-character string. 2-character strings represent special function keys. If no key was read because blocking is disabled or the timeout ran out, returns ``None`` instead.
     :rtype: str
     """
-    # Return None if blocking disabled and no key is waiting to be read
     if not blocking:
-        if msvcrt.kbhit() == 0:
-            return None
+        timeout = 0
 
-    # Grab the key that was pressed
-    first_key: str = msvcrt.getwch()
+    if _listener_keys or _listener_thread is not None:
+        return _read_listener_key(blocking, timeout)
+    if _console_input:
+        return _read_console_key(_INFINITE if timeout is None else min(max(0, round(timeout * 1000)), _INFINITE - 1))
 
-    # Return the key, unless it is an escape code that signifies a special function key
-    if first_key not in ('\x00', '\xe0'):
-        return first_key
+    # Return None if no key is waiting to be read before the timeout (a non-console stdin can't be waited on)
+    if timeout is not None:
+        deadline: float = time.perf_counter() + timeout
+        while not _has_key():
+            if time.perf_counter() >= deadline:
+                return None
+            time.sleep(_FALLBACK_POLL_INTERVAL)
+    return _read_msvcrt_key()
 
-    # If it was a special function key, read the second part and return the full code
-    second_key: str = msvcrt.getwch()
-    return first_key + second_key
+def read_key_blocking() -> str:
+    """
+    Waits for and reads one keypress. Same as ``read_key(True)``, minus the argument handling.
+
+    :return: The pressed key as a 1 or 2-character string. 2-character strings represent special function keys.
+    :rtype: str
+    """
+    if _listener_keys or _listener_thread is not None:
+        return _read_listener_key(True, None)
+    if _console_input:
+        return _read_console_key(_INFINITE)
+    return _read_msvcrt_key()
+
+def try_read_key() -> str | None:
+    """
+    Reads one keypress if a key was pressed. Same as ``read_key(False)``, minus the argument handling.
+
+    :return: The pressed key as a 1 or 2-character string. 2-character strings represent special function keys. If no key was read, returns ``None`` instead.
+    :rtype: str | None
+    """
+    if _listener_keys or _listener_thread is not None:
+        return _read_listener_key(False, 0)
+    if _console_input:
+        return _read_console_key(0)
+    if not _has_key():
+        return None
+    return _read_msvcrt_key()
+
+def iter_pending() -> Iterator[str]:
+    """
+    Reads keypresses one at a time until there are none left to read.
+    Unlike ``dump_cache()``, keys after the point where the caller stops iterating are left unread.
+    Keys pressed while iterating are also read.
+
+    :return: An iterator of every keypress that was read.
+    :rtype: Iterator[str]
+    """
+    while (next_key := try_read_key()) is not None:
+        yield next_key
 
 def dump_cache() -> list[str]:
     """
@@ -103,6 +477,131 @@ def dump_cache() -> list[str]:
     :rtype: list[str]
     """
     cache: list[str] = []
-    while (next_key := read_key(False)) is not None:
+    while _listener_keys:
+        cache.append(_listener_keys.popleft())
+    if _listener_thread is not None:
+        return cache
+    if not _console_input:
+        cache.extend(iter_pending())
+        return cache
+
+    # Read every record that is queued right now
+    cache.extend(_pending_keys)
+    _pending_keys.clear()
+    count: wintypes.DWORD = wintypes.DWORD()
+    if not _kernel32.GetNumberOfConsoleInputEvents(_STDIN_HANDLE, ctypes.byref(count)) or count.value == 0:
+        return cache
+    num_records: int = count.value
+
+    append_key: Callable[[str], None] = cache.append
+    decode_key_press: Callable[[_INPUT_RECORD], str | None] = _decode_key_press
+    while num_records > 0:
+        if not _kernel32.ReadConsoleInputW(_STDIN_HANDLE, _input_buffer, min(num_records, _INPUT_BUFFER_SIZE), ctypes.byref(count)) or count.value == 0:
+            break
+        num_records -= count.value
+
+        for record in _input_buffer[:count.value]:
+            if (key := decode_key_press(record)) is None:
+                continue
+
+            # A held key can be reported as one record with a repeat count
+            if (repeat_count := record.Event.KeyEvent.wRepeatCount) > 1:
+                cache.extend([key] * repeat_count)
+            else:
+                append_key(key)
+    return cache
+
+def classify(key: str) -> int:
+    """
+    Returns the integer ID of a key, so it can be compared with the members of ``Key`` instead of the key code strings.
+
+    :param key: The key, e.g. from ``read_key()``.
+    :type key: str
+    :return: The ID of the key (equal to a member of ``Key``), or -1 if the key has no constant in this module.
+    :rtype: int
+    """
+    return _KEY_IDS.get(key, -1)
+
+def read_key_id(blocking: bool = True, timeout: float | None = None) -> int | None:
+    """
+    Reads one keypress as the integer ID from ``classify()``.
+
+    :param blocking: If enabled, waits for a keypress. Otherwise, checks if a key was pressed.
+    :type blocking: bool
+    :param timeout: If blocking is enabled, the maximum number of seconds to wait for a keypress, or None to wait forever.
+    :type timeout: float | None
+    :return: The ID of the pressed key (-1 for keys with no constant in this module). If no key was read because blocking is disabled or the timeout ran out, returns ``None`` instead.
+    :rtype: int | None
+    """
+    key: str | None = read_key(blocking, timeout)
+    if key is None:
+        return None
+    return _KEY_IDS.get(key, -1)
+
+def bind(key: str, handler: Callable[[str], Any] | None) -> None:
+    """
+    Sets the function that ``dispatch()`` calls when it gets a certain key.
+
+    :param key: The key, e.g. ``UP_ARROW`` or ``'q'``.
+    :type key: str
+    :param handler: The function to call with the key, or None to remove the key's handler.
+    :type handler: Callable[[str], Any] | None
+    :rtype: None
+    """
+    if handler is None:
+        _key_handlers.pop(key, None)
+    else:
+        _key_handlers[key] = handler
+
+def dispatch(key: str | None) -> bool:
+    """
+    Calls the handler set by ``bind()`` for a key, if there is one.
+
+    :param key: The key, e.g. from ``read_key()``. None is accepted and ignored so that non-blocking reads can be passed in directly.
+    :type key: str | None
+    :return: True if a handler was called.
+    :rtype: bool
+    """
+    handler: Callable[[str], Any] | None = _key_handlers.get(key)
+    if handler is None:
+        return False
+    handler(key)
+    return True
+
+def read_key_bytes(blocking: bool = True) -> bytes | None:
+    """
+    Reads one keypress as bytes, which skips decoding the key into a string.
+    Compare the result with the constants in ``KEYS_BYTES``.
+
+    Cannot be used while the listener from ``start_listener()`` is running.
+
+    :param blocking: If enabled, waits for a keypress. Otherwise, checks if a key was pressed.
+    :type blocking: bool
+    :return: The pressed key as 1 or 2 bytes. 2 bytes represent special function keys. If blocking is disabled and no key was read, returns ``None`` instead.
+    :rtype: bytes
+    """
+    if _listener_thread is not None:
+        raise ValueError('Attempted to read a key as bytes, but the key listener is running and the two features are mutually exclusive!')
+
+    # Return None if blocking disabled and no key is waiting to be read
+    if not blocking:
+        if not _has_key():
+            return None
+
+    # Grab the key that was pressed, and the second part if it is a special function key
+    first_key: bytes = _getch()
+    if first_key not in _ESC_PREFIXES_BYTES:
+        return first_key
+    return first_key + _getch()
+
+def dump_cache_bytes() -> list[bytes]:
+    """
+    Reads keypresses as bytes until there are none left to read.
+
+    :return: Every keypress that was read.
+    :rtype: list[bytes]
+    """
+    cache: list[bytes] = []
+    while (next_key := read_key_bytes(False)) is not None:
         cache.append(next_key)
     return cache
@@ -11,11 +11,15 @@ A small module written by Soup for basic text UI and user input.
 # IMPORTS
 
 from typing import Callable, Any
+import functools
 import platform
 import random
+import re
+import atexit
 import shutil
 import math
 import time
+import sys
 import os
 
 # GLOBALS & CONSTANTS
@@ -23,18 +27,45 @@ import os
 _BLOCK_CHARACTERS: list[str] = [' ', '░', '▒', '▓', '█']
 if platform.python_implementation() == 'PyPy': # normal block characters break in PyPy for some reason
     _BLOCK_CHARACTERS = [' ', '.', '-', '=', '#']
+_BLOCK_CHARACTERS = [sys.intern(c) for c in _BLOCK_CHARACTERS]
 _PROGRESS_BAR_LENGTH: int = 50
-_MAX_PRINTED_TEXT_SIZE: int = 360000 # max allowed size (number of characters) for the "_printed_text" cache
-
-_printed_text: str = ''
-_fragile_text: str = ''
+_TIME_UNIT_RATIOS: tuple[int, ...] = (1, 60, 3600, 24 * 3600) # seconds in a second, minute, hour, and day
+_BAR_LEVELS: int = len(_BLOCK_CHARACTERS) - 1 # fill levels per block, not counting empty
+_MAX_BAR_LEVEL: int = _PROGRESS_BAR_LENGTH * _BAR_LEVELS
+_FULL_BAR: str = _BLOCK_CHARACTERS[-1] * _PROGRESS_BAR_LENGTH # progress bars are sliced out of these
+_EMPTY_BAR: str = _BLOCK_CHARACTERS[0] * _PROGRESS_BAR_LENGTH
+_IS_WINDOWS: bool = platform.system() == 'Windows' # like the PyPy check above, this can't change while running, so it's only checked once
+_CLEAR_COMMAND: str = 'cls' if _IS_WINDOWS else 'clear'
+_FOREGROUND_COLORS: tuple[str, ...] = tuple(f'\033[38;5;{i}m' for i in range(256)) # escape codes for all 8-bit colors, indexed by color ID
+_BACKGROUND_COLORS: tuple[str, ...] = tuple(f'\033[48;5;{i}m' for i in range(256))
+_MAX_PRINTED_TEXT_SIZE: int = 360000 # max allowed size (number of characters) for the "_printed_chunks" cache
+_USERNAME_CHARACTERS: str = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-' # the characters "_main()" allows in a username
+
+_printed_chunks: list[str] = [] # the printed text, in the pieces it was printed in
+_printed_length: int = 0 # total number of characters in "_printed_chunks"
+_fragile_chunks: list[str] = [] # the fragile text, in the pieces it was printed in
+_fragile_length: int = 0 # total number of characters in "_fragile_chunks"
 _title: str = 'Untitled'
 _debug_mode: bool = False
 _use_fast_clear: bool = True
 _fragile_mode: bool = False
 _manual_refresh_mode: bool = False
 _screen_up_to_date: bool = True
-_print: Callable = print
+_terminal_size: tuple[int, int] | None = None # cached by "get_terminal_size()"
+_terminal_size_time: float = 0 # time.monotonic() timestamp of when "_terminal_size" was cached
+_TERMINAL_SIZE_TTL: float = 0.05 # how many seconds the cached terminal size is trusted for
+_write_coalescing: bool = False
+_write_buffer: list[str] = [] # text waiting to be written to the terminal while write coalescing is enabled
+_write_deadline: float = 0 # time.perf_counter() timestamp after which "_write_buffer" is written out on the next write
+_WRITE_COALESCING_DELAY: float = 0.005 # max seconds text is held in "_write_buffer" before the next write flushes it
+_REASON_BAD_FORMAT: int = 1 << 0 # bit flags for the rules a special input can break, in the order their messages are shown
+_REASON_NOT_WHOLE: int = 1 << 1
+_REASON_TOO_SMALL: int = 1 << 2
+_REASON_TOO_LARGE: int = 1 << 3
+_REASON_NOT_WHITELISTED: int = 1 << 4
+_REASON_BLACKLISTED: int = 1 << 5
+_format_dirty: bool = True # whether formatting may be applied on the terminal (or in text queued by manual refresh mode) since the last reset it was sent; starts True because what came before is unknown
+_output_generation: int = 0 # counts every print, input, screen clear and reprint, so "ProgressBar" can tell if something else was shown since its last frame
 _input: Callable = input
 
 # DEFINITIONS
@@ -57,26 +88,27 @@ class ANSI:
     INVERT: str = '\033[7m'
 
     # Foreground Color
-    BLACK: str = '\033[38;5;0m'   ; GRAY: str = '\033[38;5;8m'
-    RED: str = '\033[38;5;1m'     ; BRIGHT_RED: str = '\033[38;5;9m'
-    GREEN: str = '\033[38;5;2m'   ; BRIGHT_GREEN: str = '\033[38;5;10m'
-    YELLOW: str = '\033[38;5;3m'  ; BRIGHT_YELLOW: str = '\033[38;5;11m'
-    BLUE: str = '\033[38;5;4m'    ; BRIGHT_BLUE: str = '\033[38;5;12m'
-    MAGENTA: str = '\033[38;5;5m' ; BRIGHT_MAGENTA: str = '\033[38;5;13m'
-    CYAN: str = '\033[38;5;6m'    ; BRIGHT_CYAN: str = '\033[38;5;14m'
-    WHITE: str = '\033[38;5;7m'   ; BRIGHT_WHITE: str = '\033[38;5;15m'
+    BLACK: str = _FOREGROUND_COLORS[0]   ; GRAY: str = _FOREGROUND_COLORS[8]
+    RED: str = _FOREGROUND_COLORS[1]     ; BRIGHT_RED: str = _FOREGROUND_COLORS[9]
+    GREEN: str = _FOREGROUND_COLORS[2]   ; BRIGHT_GREEN: str = _FOREGROUND_COLORS[10]
+    YELLOW: str = _FOREGROUND_COLORS[3]  ; BRIGHT_YELLOW: str = _FOREGROUND_COLORS[11]
+    BLUE: str = _FOREGROUND_COLORS[4]    ; BRIGHT_BLUE: str = _FOREGROUND_COLORS[12]
+    MAGENTA: str = _FOREGROUND_COLORS[5] ; BRIGHT_MAGENTA: str = _FOREGROUND_COLORS[13]
+    CYAN: str = _FOREGROUND_COLORS[6]    ; BRIGHT_CYAN: str = _FOREGROUND_COLORS[14]
+    WHITE: str = _FOREGROUND_COLORS[7]   ; BRIGHT_WHITE: str = _FOREGROUND_COLORS[15]
 
     # Background Color
-    BLACK_BG: str = '\033[48;5;0m'   ; GRAY_BG: str = '\033[48;5;8m'
-    RED_BG: str = '\033[48;5;1m'     ; BRIGHT_RED_BG: str = '\033[48;5;9m'
-    GREEN_BG: str = '\033[48;5;2m'   ; BRIGHT_GREEN_BG: str = '\033[48;5;10m'
-    YELLOW_BG: str = '\033[48;5;3m'  ; BRIGHT_YELLOW_BG: str = '\033[48;5;11m'
-    BLUE_BG: str = '\033[48;5;4m'    ; BRIGHT_BLUE_BG: str = '\033[48;5;12m'
-    MAGENTA_BG: str = '\033[48;5;5m' ; BRIGHT_MAGENTA_BG: str = '\033[48;5;13m'
-    CYAN_BG: str = '\033[48;5;6m'    ; BRIGHT_CYAN_BG: str = '\033[48;5;14m'
-    WHITE_BG: str = '\033[48;5;7m'   ; BRIGHT_WHITE_BG: str = '\033[48;5;15m'
+    BLACK_BG: str = _BACKGROUND_COLORS[0]   ; GRAY_BG: str = _BACKGROUND_COLORS[8]
+    RED_BG: str = _BACKGROUND_COLORS[1]     ; BRIGHT_RED_BG: str = _BACKGROUND_COLORS[9]
+    GREEN_BG: str = _BACKGROUND_COLORS[2]   ; BRIGHT_GREEN_BG: str = _BACKGROUND_COLORS[10]
+    YELLOW_BG: str = _BACKGROUND_COLORS[3]  ; BRIGHT_YELLOW_BG: str = _BACKGROUND_COLORS[11]
+    BLUE_BG: str = _BACKGROUND_COLORS[4]    ; BRIGHT_BLUE_BG: str = _BACKGROUND_COLORS[12]
+    MAGENTA_BG: str = _BACKGROUND_COLORS[5] ; BRIGHT_MAGENTA_BG: str = _BACKGROUND_COLORS[13]
+    CYAN_BG: str = _BACKGROUND_COLORS[6]    ; BRIGHT_CYAN_BG: str = _BACKGROUND_COLORS[14]
+    WHITE_BG: str = _BACKGROUND_COLORS[7]   ; BRIGHT_WHITE_BG: str = _BACKGROUND_COLORS[15]
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024, typed=True)
     def place_cursor(row: int = 1, column: int = 1) -> str:
         """
         Returns the ANSI escape code that places the cursor at the specified coordinates.
@@ -91,6 +123,7 @@ class ANSI:
         return f'\033[{row};{column}H'
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024, typed=True)
     def move_cursor_to_column(column: int = 1) -> str:
         """
         Returns the ANSI escape code that moves the cursor to the specified column.
@@ -103,6 +136,7 @@ class ANSI:
         return f'\033[{column}G'
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024, typed=True)
     def move_cursor(down: int = 0, forward: int = 0) -> str:
         """
         Returns the ANSI escape code that moves the cursor relative to its current position.
@@ -129,6 +163,7 @@ class ANSI:
         return y_part + x_part
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024, typed=True)
     def move_cursor_vertical(down: int = 1) -> str:
         """
         Returns the ANSI escape code that moves the cursor down a certain number of lines.
@@ -145,6 +180,7 @@ class ANSI:
         return ''
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024, typed=True)
     def color(*args: int) -> str:
         """
         Returns the ANSI escape code that changes the text color to a certain ID or RGB value.
@@ -159,10 +195,13 @@ class ANSI:
             raise ValueError(f'1 or 3 arguments expected, not {len(args)}!')
 
         if len(args) == 1:
+            if type(args[0]) is int and 0 <= args[0] < 256:
+                return _FOREGROUND_COLORS[args[0]]
             return f'\033[38;5;{args[0]}m'
         return f'\033[38;2;{args[0]};{args[1]};{args[2]}m'
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024, typed=True)
     def background_color(*args: int) -> str:
         """
         Returns the ANSI escape code that changes the text background color to a certain ID or RGB value.
@@ -177,6 +216,8 @@ class ANSI:
             raise ValueError(f'1 or 3 arguments expected, not {len(args)}!')
 
         if len(args) == 1:
+            if type(args[0]) is int and 0 <= args[0] < 256:
+                return _BACKGROUND_COLORS[args[0]]
             return f'\033[48;5;{args[0]}m'
         return f'\033[48;2;{args[0]};{args[1]};{args[2]}m'
 
@@ -193,6 +234,19 @@ class ANSI:
     CUP: Callable = place_cursor
     CHA: Callable = move_cursor_to_column
 
+# The constant escape codes are searched for and concatenated constantly, so they're interned
+for _name, _value in list(vars(ANSI).items()):
+    if _name.isupper() and isinstance(_value, str):
+        setattr(ANSI, _name, sys.intern(_value))
+del _name, _value
+
+_CLEAR_SCREEN: str = ANSI.CLEAR_SCREEN
+_CLEAR_TEXT_AFTER_CURSOR: str = ANSI.CLEAR_TEXT_AFTER_CURSOR
+_RESET: str = ANSI.RESET
+_RED: str = ANSI.RED
+_GREEN: str = ANSI.GREEN
+_RESET_PREFIXED: dict[str, str] = {format: sys.intern(_RESET + format) for format in ('', ANSI.CYAN, ANSI.GRAY, _GREEN, _RED)} # common formats with a reset before them
+
 def is_fast_clear_enabled() -> bool:
     """
     Checks whether fast clear is enabled.
@@ -237,6 +291,17 @@ def is_debug_mode() -> bool:
 
     return _debug_mode
 
+def is_write_coalescing_enabled() -> bool:
+    """
+    Checks whether write coalescing is enabled.
+
+    :return: True if write coalescing is enabled.
+    :rtype: bool
+    """
+    global _write_coalescing
+
+    return _write_coalescing
+
 def get_displayed_text(include_fragile: bool = True) -> str:
     """
     Returns all text currently displayed in the terminal.
@@ -248,12 +313,9 @@ def get_displayed_text(include_fragile: bool = True) -> str:
     :return: The text displayed in the terminal.
     :rtype: str
     """
-    global _printed_text
-    global _fragile_text
-
     if include_fragile:
-        return _printed_text + _fragile_text
-    return _printed_text
+        return _materialize_printed() + ''.join(_fragile_chunks)
+    return _materialize_printed()
 
 def get_title() -> str:
     """
@@ -273,11 +335,64 @@ def get_terminal_size() -> tuple[int, int]:
     :return: The size of the terminal in characters; a tuple of width and height.
     :rtype: tuple[int, int]
     """
-    # noinspection PyTypeChecker
-    return tuple(shutil.get_terminal_size())
+    global _terminal_size
+    global _terminal_size_time
+
+    # The size is only trusted for a short time, so a resize shows up almost right away
+    if _terminal_size is None or time.monotonic() - _terminal_size_time > _TERMINAL_SIZE_TTL:
+        # noinspection PyTypeChecker
+        _terminal_size = tuple(shutil.get_terminal_size())
+        _terminal_size_time = time.monotonic()
+    return _terminal_size
 
 # Formatting
 
+def _format_real(x: int | float, leading_zeroes: int, decimal_places: int | None, separate_thousands: bool, percentage: bool, leave_slot_for_neg_sign: bool) -> str:
+    # the body of format_number() for real numbers, which complex numbers also use for both parts
+
+    # handle percentages
+    if percentage:
+        x *= 100
+
+    # round with the format mini-language, which also splits the digits on either side of the decimal point
+    places: int
+    if decimal_places is not None and decimal_places < 0: # the format mini-language can't round to tens, hundreds, etc.
+        x = round(x, decimal_places)
+        places = 0
+    elif decimal_places is not None:
+        places = decimal_places
+    elif x % 1 == 0:
+        places = 0
+    else:
+        places = len(str(x).split('.')[1])
+    integer_digits: str
+    decimal_digits: str
+    if isinstance(x, int): # ints are kept exact instead of going through a float
+        integer_digits, decimal_digits = str(abs(x)), '0' * places
+    else:
+        integer_digits, _, decimal_digits = f'{abs(x):.{places}f}'.partition('.')
+
+    # format integer part
+    integer_part_number: int = int(integer_digits)
+    integer_part: str
+    if separate_thousands:
+        integer_part = f'{integer_part_number:,}' if integer_part_number != 0 else '0'
+        integer_part = integer_part.rjust(leading_zeroes + integer_part.count(','), '0')
+    else:
+        integer_part = (integer_digits if integer_part_number != 0 else '').rjust(leading_zeroes, '0') # the digits are already a string
+
+    # format sign
+    sign: str = ''
+    if x < 0 and (integer_part_number != 0 or decimal_digits.strip('0')): # if both integer part and decimal part are 0, don't show negative sign
+        sign = '-'
+    elif leave_slot_for_neg_sign:
+        sign = ' ' # add a space where the negative sign would go if "leave_slot_for_neg_sign" is enabled
+
+    # combine formatted parts in one go
+    decimal_point: str = '.' if decimal_digits else ''
+    percent_sign: str = '%' if percentage else ''
+    return f'{sign}{integer_part}{decimal_point}{decimal_digits}{percent_sign}'
+
 def format_number(n: int | float | complex, leading_zeroes: int = 1, decimal_places: int | None = None, separate_thousands: bool = True, percentage: bool = False, leave_slot_for_neg_sign: bool = False) -> str:
     """
     Formats a number.
@@ -300,53 +415,15 @@ def format_number(n: int | float | complex, leading_zeroes: int = 1, decimal_pla
 
     # handle complex numbers
     if isinstance(n, complex):
-        formatted_real: str = format_number(n.real, leading_zeroes, decimal_places, separate_thousands, percentage, leave_slot_for_neg_sign)
-        formatted_imag: str = format_number(n.imag, leading_zeroes, decimal_places, separate_thousands, percentage, True) + 'i'
+        formatted_real: str = _format_real(n.real, leading_zeroes, decimal_places, separate_thousands, percentage, leave_slot_for_neg_sign)
+        formatted_imag: str = _format_real(n.imag, leading_zeroes, decimal_places, separate_thousands, percentage, True)
 
         # if the imaginary component is positive, add a positive sign
         if formatted_imag[0] == ' ': # the imaginary part always has "leave_slot_for_neg_sign" enabled so positive numbers will start with a space
-            formatted_imag = '+' + formatted_imag[1:]
+            return f'{formatted_real}+{formatted_imag[1:]}i'
+        return f'{formatted_real}{formatted_imag}i'
 
-        return formatted_real + formatted_imag
-
-    # handle percentages
-    if percentage:
-        n *= 100
-
-    # round
-    if decimal_places is not None:
-        n = round(n, decimal_places)
-
-    # format integer part
-    integer_part_number: int = math.floor(abs(n))
-    integer_part: str = str(integer_part_number)
-    if integer_part_number == 0:
-        integer_part = ''
-    if separate_thousands:
-        integer_part = f'{integer_part_number:,}'
-    integer_part = integer_part.rjust(leading_zeroes + integer_part.count(','), '0')
-
-    # format decimal part
-    decimal_part_number: int = 0
-    decimal_part: str = ''
-    if decimal_places is None:
-        if n % 1 == 0:
-            decimal_places = 0
-        else:
-            decimal_places = len(str(n).split('.')[1])
-    if decimal_places > 0:
-        decimal_part_number = math.floor((abs(n) % 1) * (10 ** decimal_places))
-        decimal_part = f'.{decimal_part_number:0>{decimal_places}}'
-
-    # combine formatted parts
-    formatted_number: str = integer_part + decimal_part
-    if n < 0 and (integer_part_number != 0 or decimal_part_number != 0): # if both integer part and decimal part are 0, don't show negative sign
-        formatted_number = '-' + formatted_number
-    elif leave_slot_for_neg_sign:
-        formatted_number = ' ' + formatted_number # add a space where the negative sign would go if "leave_slot_for_neg_sign" is enabled
-    if percentage:
-        formatted_number += '%'
-    return formatted_number
+    return _format_real(n, leading_zeroes, decimal_places, separate_thousands, percentage, leave_slot_for_neg_sign)
 
 def format_time(s: float, decimal_places: int | None = 3, min_units: int = 3, shorten_largest_unit: bool = False) -> str:
     """
@@ -363,55 +440,28 @@ def format_time(s: float, decimal_places: int | None = 3, min_units: int = 3, sh
     :return: The formatted time.
     :rtype: str
     """
-    # Constants
-    unit_ratios: list[float] = [1, 60, 3600, 24 * 3600]
-    num_units: int = len(unit_ratios)
-
     # Validation
+    num_units: int = len(_TIME_UNIT_RATIOS)
     if min_units > num_units:
         raise ValueError(f'There are only {num_units} units; tried to show {min_units}!')
     if min_units < 1:
         raise ValueError('There must be at least 1 unit!')
 
-    # Get each unit's value
-    unit_values: list[int | float] = []
-    for unit in range(num_units):
-        # Get unit ratio
-        ratio: float = unit_ratios[unit]
-        next_ratio: float | None
-        if unit < num_units - 1:
-            next_ratio = unit_ratios[unit + 1]
-        else:
-            next_ratio = None
+    # Get each unit's value (seconds, minutes, hours, days); the largest unit isn't wrapped
+    unit_values: tuple[int | float, ...] = (s % 60, (s // 60) % 60, (s // 3600) % 24, s // (24 * 3600))
 
-        # Stop adding units if all next units would show 0, and minimum requirement met
-        if s < ratio and unit >= min_units:
-            break
+    # Show more than the minimum number of units only while the time reaches them
+    actual_num_units: int = min_units
+    while actual_num_units < num_units and not s < _TIME_UNIT_RATIOS[actual_num_units]:
+        actual_num_units += 1
 
-        # Get unit value
-        unit_value: int | float
-        if unit == 0:
-            unit_value = s % next_ratio
-        elif unit == num_units - 1:
-            unit_value = s // ratio
-        else:
-            unit_value = (s // ratio) % (next_ratio // ratio)
-        unit_values.append(unit_value)
-    actual_num_units: int = len(unit_values)
-
-    # Format each unit
-    formatted_units: list[str] = []
-    for unit in range(actual_num_units):
-        unit_value: int | float = unit_values[unit]
-        formatted_units.append(
-            format_number(unit_value,
-                          leading_zeroes=(1 if unit == actual_num_units - 1 and shorten_largest_unit else 2),
-                          decimal_places=(decimal_places if unit == 0 else 0))
-        )
-    formatted_units.reverse()
-
-    # Return
-    return ':'.join(formatted_units)
+    # Format each unit, largest first
+    return ':'.join([
+        format_number(unit_values[unit],
+                      leading_zeroes=(1 if unit == actual_num_units - 1 and shorten_largest_unit else 2),
+                      decimal_places=(decimal_places if unit == 0 else 0))
+        for unit in range(actual_num_units - 1, -1, -1)
+    ])
 
 # Settings
 
@@ -430,6 +480,25 @@ def use_fast_clear(enable: bool = True) -> None:
 
     _use_fast_clear = enable
 
+def use_write_coalescing(enable: bool = True) -> None:
+    """
+    Enables or disables write coalescing.
+
+    With write coalescing on, printed text is collected and written to the terminal in one go instead of with a write for each print.
+    Collected text is written before inputs, on refreshes and screen clears, when disabling write coalescing, when the program exits,
+    and by the first print made more than 5 milliseconds after the oldest collected text.
+    This trades a little latency for far fewer writes; text printed right before a long pause without any input may appear late.
+
+    :param enable: Whether to enable write coalescing.
+    :type enable: bool
+    :rtype: None
+    """
+    global _write_coalescing
+
+    if not enable:
+        _flush_output()
+    _write_coalescing = enable
+
 def begin_fragile_text() -> None:
     """
     Marks the beginning of a fragile text block, which will be deleted if the screen is refreshed using ``refresh()`` or ``update()``.
@@ -464,13 +533,13 @@ def solidify() -> None:
 
     :rtype: None
     """
-    global _printed_text
-    global _fragile_text
+    global _fragile_length
     global _fragile_mode
 
     _fragile_mode = False
-    _update_printed_text(_fragile_text)
-    _fragile_text = ''
+    _update_printed_text(*_fragile_chunks) # the chunks are moved over as they are, without joining them
+    _fragile_chunks.clear()
+    _fragile_length = 0
 
 def manual_refresh_mode(enable: bool = True) -> None:
     """
@@ -523,22 +592,72 @@ def set_title(text: str) -> None:
 
 # Text UI Management
 
-def _update_printed_text(new_text: str = '') -> None:
-    global _printed_text
-    global _fragile_text
-    global _fragile_mode
+def _write(text: str) -> None:
+    # writes to the terminal, going through "_write_buffer" if write coalescing is enabled
+    global _write_deadline
+
+    if not _write_coalescing:
+        sys.stdout.write(text)
+        return
+
+    if not _write_buffer:
+        _write_deadline = time.perf_counter() + _WRITE_COALESCING_DELAY
+    _write_buffer.append(text)
+    if time.perf_counter() >= _write_deadline:
+        _flush_output()
+
+def _flush_output() -> None:
+    # writes out any text collected by write coalescing, then flushes the terminal
+    if _write_buffer:
+        sys.stdout.write(''.join(_write_buffer))
+        _write_buffer.clear()
+    sys.stdout.flush()
+
+atexit.register(_flush_output)
+
+def _may_apply_formatting(text: str) -> bool:
+    # formatting escape codes end in "m", and other text with both is conservatively counted too;
+    # a reset at the very start (like the one print() adds) doesn't apply any formatting, so it's skipped
+    start: int = len(_RESET) if text.startswith(_RESET) else 0
+    return text.find('\033[', start) != -1 and text.find('m', start) != -1
+
+def _format_dirty_after(text: str) -> bool:
+    # whether formatting may be applied once text has been written to the terminal
+    return _may_apply_formatting(text) or (_format_dirty and not text.startswith(_RESET))
+
+def _materialize_printed() -> str:
+    # joins the printed text and keeps it as a single chunk, so reading it again before the next print doesn't join it again
+    text: str = ''.join(_printed_chunks)
+    _printed_chunks[:] = [text]
+    return text
+
+def _update_printed_text(*new_texts: str) -> None:
+    global _printed_length
+    global _fragile_length
 
     if _fragile_mode:
-        _fragile_text += new_text
-        if (size := len(_fragile_text)) > _MAX_PRINTED_TEXT_SIZE:
-            _fragile_text = ''
+        _fragile_chunks.extend(new_texts)
+        _fragile_length += sum(map(len, new_texts))
+        if (size := _fragile_length) > _MAX_PRINTED_TEXT_SIZE:
+            _fragile_chunks.clear()
+            _fragile_length = 0
             raise MemoryError(f'Max printed (fragile) text size exceeded ({size}/{_MAX_PRINTED_TEXT_SIZE} characters).')
         return
 
-    _printed_text += new_text
-    _printed_text = _printed_text.split(ANSI.CLEAR_SCREEN)[-1]
-    if (size := len(_printed_text)) > _MAX_PRINTED_TEXT_SIZE:
-        _printed_text = ''
+    # The old text never contains a screen clear, so only the new text needs to be searched for one
+    clear_index: int
+    for new_text in new_texts: # the pieces are appended as they are instead of being joined first
+        clear_index = new_text.rfind(_CLEAR_SCREEN) # unlike rpartition, this doesn't copy the text before the clear
+        if clear_index != -1:
+            new_text = new_text[clear_index + len(_CLEAR_SCREEN):]
+            _printed_chunks.clear()
+            _printed_length = 0
+
+        _printed_chunks.append(new_text)
+        _printed_length += len(new_text)
+    if (size := _printed_length) > _MAX_PRINTED_TEXT_SIZE:
+        _printed_chunks.clear()
+        _printed_length = 0
         raise MemoryError(f'Max printed text size exceeded ({size}/{_MAX_PRINTED_TEXT_SIZE} characters).')
 
 def print_raw(text: str = '') -> None:
@@ -549,14 +668,20 @@ def print_raw(text: str = '') -> None:
     :type text: str
     :rtype: None
     """
-    global _printed_text
     global _screen_up_to_date
+    global _format_dirty
+    global _output_generation
 
+    _output_generation += 1
+    # "_format_dirty" follows what the terminal has actually been sent, so text held back by manual refresh mode can only make it dirtier
     if _manual_refresh_mode:
         if len(text) > 0:
             _screen_up_to_date = False
+        if _may_apply_formatting(text):
+            _format_dirty = True
     else:
-        _print(text, end='')
+        _write(text)
+        _format_dirty = _format_dirty_after(text)
     _update_printed_text(text)
 
 def input_raw(prompt: str = '') -> str:
@@ -568,15 +693,18 @@ def input_raw(prompt: str = '') -> str:
     :return: The user's input.
     :rtype: str
     """
-    global _printed_text
-    global _screen_up_to_date
+    global _format_dirty
+    global _output_generation
 
     # A refresh is required before inputs if the screen isn't up to date because otherwise there could be a gap left in the text
     if not _screen_up_to_date:
         refresh()
+    _flush_output()
 
     user_input: str = _input(prompt)
-    _update_printed_text(prompt + user_input + '\n')
+    _output_generation += 1
+    _format_dirty = _format_dirty_after(prompt)
+    _update_printed_text(prompt, user_input, '\n')
 
     return user_input
 
@@ -595,8 +723,8 @@ def print(text: str = '', end: str = '\n', format: str = '', remove_old_formatti
     :type remove_old_formatting: bool
     :rtype: None
     """
-    if remove_old_formatting:
-        format = ANSI.RESET + format
+    if remove_old_formatting and _format_dirty: # a reset is only needed if formatting was applied since the last one reached the terminal
+        format = _RESET_PREFIXED.get(format) or _RESET + format
 
     print_raw(format + text + end)
 
@@ -616,8 +744,8 @@ def input(prompt: str = ' > ', prompt_format: str = '', input_format: str = ANSI
     :return: The user's input.
     :rtype: str
     """
-    if remove_old_formatting:
-        prompt_format = ANSI.RESET + prompt_format
+    if remove_old_formatting and _format_dirty:
+        prompt_format = _RESET_PREFIXED.get(prompt_format) or _RESET + prompt_format
 
     user_input: str = input_raw(prompt_format + prompt + input_format)
     return user_input
@@ -646,29 +774,33 @@ def clear_screen() -> None:
 
     :rtype: None
     """
-    global _printed_text
-    global _fragile_text
+    global _printed_length
+    global _fragile_length
     global _fragile_mode
     global _screen_up_to_date
     global _manual_refresh_mode
+    global _output_generation
 
+    _output_generation += 1
     if _manual_refresh_mode:
         _screen_up_to_date = False
     else:
         # Actually clear the screen
         if _use_fast_clear:
-            print_raw(ANSI.CLEAR_SCREEN)
+            print_raw(_CLEAR_SCREEN)
+            if _write_coalescing:
+                _flush_output()
             _screen_up_to_date = True
         else:
-            if platform.system() == 'Windows':
-                os.system('cls')
-            else:
-                os.system('clear')
+            _flush_output() # anything not yet written has to be written before the system command clears the screen
+            os.system(_CLEAR_COMMAND)
             _screen_up_to_date = True
 
     # Update globals
-    _printed_text = ''
-    _fragile_text = ''
+    _printed_chunks.clear()
+    _printed_length = 0
+    _fragile_chunks.clear()
+    _fragile_length = 0
     _fragile_mode = False
 
 def reprint(text: str | None = None) -> None:
@@ -680,17 +812,45 @@ def reprint(text: str | None = None) -> None:
     :type text: str | None
     :rtype: None
     """
-    global _printed_text
+    global _printed_length
+    global _fragile_length
+    global _fragile_mode
+    global _screen_up_to_date
     global _manual_refresh_mode
+    global _format_dirty
+    global _output_generation
 
+    _output_generation += 1
+    is_printed_text: bool = text is None
     if text is None:
-        text = _printed_text
+        text = _materialize_printed()
+
+    # The clear, the reset (if needed), and the text are written and flushed in one go
+    if _use_fast_clear:
+        _write(_CLEAR_SCREEN + _RESET + text if _format_dirty else _CLEAR_SCREEN + text)
+        _flush_output()
+        _fragile_chunks.clear()
+        _fragile_length = 0
+        _fragile_mode = False
+        _screen_up_to_date = True
+        # The printed text is already a single chunk and never contains a screen clear; other text replaces it
+        if not is_printed_text:
+            _printed_chunks.clear()
+            _printed_length = 0
+            _update_printed_text(text)
+        _format_dirty = _may_apply_formatting(text)
+        return
 
     old_manual_refresh: bool = _manual_refresh_mode
     _manual_refresh_mode = False
 
     clear_screen()
+    # The text may have been printed starting from unformatted text, so reset formatting without adding it to the printed text
+    if _format_dirty:
+        _write(_RESET)
+        _format_dirty = False
     print_raw(text)
+    _flush_output()
 
     _manual_refresh_mode = old_manual_refresh
 
@@ -702,6 +862,10 @@ def refresh() -> None:
     """
     reprint()
 
+@functools.lru_cache(maxsize=64)
+def _dash_line(length: int) -> str:
+    return '-' * length
+
 def print_title(text: str | None = None, clear_screen_first: bool = True) -> None:
     """
     Prints text in a title format.
@@ -719,9 +883,23 @@ def print_title(text: str | None = None, clear_screen_first: bool = True) -> Non
         clear_screen()
 
     print(text.upper())
-    print('-' * max(len(text) + 2, 20))
+    print(_dash_line(max(len(text) + 2, 20)))
     print()
 
+def _progress_bar_level(progress: float) -> int:
+    # the numeric part of the progress bar, kept apart from building the string: progress quantized to an integer level
+    return int(min(max(progress, 0), 1) * _MAX_BAR_LEVEL)
+
+@functools.lru_cache(maxsize=None) # there are only _MAX_BAR_LEVEL + 1 levels
+def _build_progress_bar(level: int) -> str:
+    # full blocks, then one partially filled block, then empty blocks
+    full_blocks: int
+    partial_block_level: int
+    full_blocks, partial_block_level = divmod(level, _BAR_LEVELS)
+    if full_blocks >= _PROGRESS_BAR_LENGTH:
+        return _FULL_BAR
+    return _FULL_BAR[:full_blocks] + _BLOCK_CHARACTERS[partial_block_level] + _EMPTY_BAR[full_blocks + 1:]
+
 def show_progress_bar(text: str, progress: float, finished: bool = False, start_time: float | None = None) -> None:
     """
     Displays a progress bar.
@@ -736,34 +914,28 @@ def show_progress_bar(text: str, progress: float, finished: bool = False, start_
     :type start_time: float | None
     :rtype: None
     """
-    num_block_characters: int = len(_BLOCK_CHARACTERS)
-
-    # generate main progress bar
-    progress_bar: str = ''
-    for i in range(_PROGRESS_BAR_LENGTH):
-        block_progress: float = progress * _PROGRESS_BAR_LENGTH - i
-        if block_progress > 1:
-            block_progress = 1
-        elif block_progress < 0:
-            block_progress = 0
-
-        block_character: str = _BLOCK_CHARACTERS[math.floor(block_progress * (num_block_characters - 1))]
-        progress_bar += block_character
+    # generate main progress bar; it only depends on the quantized level, so it's built once per level
+    progress_bar: str = _build_progress_bar(_progress_bar_level(progress))
 
     # generate ETA
     eta: str = ''
     if start_time is not None and 0 < progress < 1:
-        now: float = time.time()
-        delta_time: float = now - start_time
+        delta_time: float = time.time() - start_time
         if delta_time > 10: # only show ETA after 10 seconds have passed to give a more accurate prediction
             estimated_remaining: float = (delta_time / progress) * (1 - progress)
-            eta = f' (ETA {str(math.floor(estimated_remaining / 3600)).zfill(2)}:{str(math.floor(estimated_remaining / 60) % 60).zfill(2)}:{str(math.floor(estimated_remaining) % 60).zfill(2)})'
+            hours: int
+            minutes: int
+            seconds: int
+            hours, seconds = divmod(int(estimated_remaining), 3600)
+            minutes, seconds = divmod(seconds, 60)
+            eta = f' (ETA {hours:02}:{minutes:02}:{seconds:02})'
 
     # print to terminal
     if not finished:
         begin_fragile_text()
-    print(f'{text} [{ANSI.GREEN}{progress_bar}{ANSI.RESET}] {ANSI.GREEN}{math.floor(progress * 100000) / 1000:.3f}%{eta}' + ANSI.CLEAR_TEXT_AFTER_CURSOR, end=('\n' if finished else '\r'))
+    print(f'{text} [{_GREEN}{progress_bar}{_RESET}] {_GREEN}{math.floor(progress * 100000) / 1000:.3f}%{eta}{_CLEAR_TEXT_AFTER_CURSOR}', end=('\n' if finished else '\r'))
     if finished:
+        _flush_output()
         solidify()
 
 class ProgressBar:
@@ -788,6 +960,7 @@ class ProgressBar:
         self.progress: float = progress
         self.max_progress: float = max_progress
         self.start_time: float = time.time() if start_time is None else start_time
+        self._last_state: tuple[str, int, int, int] | None = None # what was last shown and "_output_generation" right after, to skip redrawing an identical progress bar
 
     def set_text(self, text: str) -> None:
         """
@@ -819,8 +992,16 @@ class ProgressBar:
         """
         if progress is not None:
             self.progress = progress
+        fraction: float = self.progress / self.max_progress
+
+        # only redraw if the text, the shown percentage, or the second the ETA is based on has changed,
+        # and nothing else has been printed (or the screen cleared or reprinted) since the last frame
+        state: tuple[str, int, int] = (self.text, math.floor(fraction * 100000), math.floor(time.time() - self.start_time))
+        if self._last_state is not None and self._last_state[:3] == state and self._last_state[3] == _output_generation:
+            return
 
-        show_progress_bar(self.text, self.progress / self.max_progress, False, self.start_time)
+        show_progress_bar(self.text, fraction, False, self.start_time)
+        self._last_state = (*state, _output_generation)
 
     def finish(self) -> None:
         """
@@ -882,7 +1063,7 @@ def press_enter_to_retry() -> None:
 
 # Special Inputs
 
-def _special_input(validator: Callable[[str], tuple[bool, list[str], Any]], prompt: str | None, end: str, fallback_if_blank: Any, keep_asking_until_valid: bool):
+def _special_input(validator: Callable[[str], tuple[int, Any]], reason_messages: dict[int, str], prompt: str | None, end: str, fallback_if_blank: Any, keep_asking_until_valid: bool):
     while True:
         begin_fragile_text()
 
@@ -897,22 +1078,24 @@ def _special_input(validator: Callable[[str], tuple[bool, list[str], Any]], prom
             return fallback_if_blank
 
         # validate input
-        input_is_valid: bool
-        invalid_reasons: list[str]
+        invalid_reasons: int
         output: Any
-        input_is_valid, invalid_reasons, output = validator(user_input)
+        invalid_reasons, output = validator(user_input)
 
-        # tell the user if their input is invalid
-        if not input_is_valid:
-            print('Invalid input:', format=ANSI.RED)
-            for reason in invalid_reasons:
-                print(f'   {reason}', format=ANSI.RED)
+        # tell the user if their input is invalid, going through the set reason bits from lowest to highest
+        if invalid_reasons:
+            print('Invalid input:', format=_RED)
+            remaining_reasons: int = invalid_reasons
+            while remaining_reasons:
+                reason: int = remaining_reasons & -remaining_reasons
+                print(f'   {reason_messages[reason]}', format=_RED)
+                remaining_reasons ^= reason
 
         # print the ending
         print_raw(end)
 
         # exit the loop conditionally
-        if input_is_valid or not keep_asking_until_valid:
+        if not invalid_reasons or not keep_asking_until_valid:
             break
 
         # if loop will continue, handle text resetting
@@ -921,11 +1104,11 @@ def _special_input(validator: Callable[[str], tuple[bool, list[str], Any]], prom
 
     # return
     solidify()
-    if input_is_valid:
+    if not invalid_reasons:
         return output
     return None
 
-def text_input(prompt: str | None = None, end: str = '\n', min_length: int | None = None, max_length: int | None = None, character_whitelist: list[str] | None = None, character_blacklist: list[str] | None = None, fallback_if_blank: str | None = None, keep_asking_until_valid: bool = False) -> str | None:
+def text_input(prompt: str | None = None, end: str = '\n', min_length: int | None = None, max_length: int | None = None, character_whitelist: str | list[str] | None = None, character_blacklist: str | list[str] | None = None, fallback_if_blank: str | None = None, keep_asking_until_valid: bool = False, only_first_reason: bool = False) -> str | None:
     """
     Prompts the user for a text input.
 
@@ -938,52 +1121,71 @@ def text_input(prompt: str | None = None, end: str = '\n', min_length: int | Non
     :param max_length: The maximum character length the user is allowed to input.
     :type max_length: int | None
     :param character_whitelist: The user must only use these characters.
-    :type character_whitelist: list[str] | None
+    :type character_whitelist: str | list[str] | None
     :param character_blacklist: The user shouldn't use these characters.
-    :type character_blacklist: list[str] | None
+    :type character_blacklist: str | list[str] | None
     :param fallback_if_blank: The string to be returned if the user doesn't input anything, or None to force the user to input something.
     :type fallback_if_blank: str | None
     :param keep_asking_until_valid: Whether to keep asking the user repeatedly until a valid response is entered.
     :type keep_asking_until_valid: bool
+    :param only_first_reason: Whether to stop checking the input at the first rule it breaks, and only tell the user about that one.
+    :type only_first_reason: bool
     :return: The text inputted by the user (or None if the user entered an invalid value).
     :rtype: str | None
     """
+    # missing length limits become bounds that can never be broken, so the length is compared against them inline
+    shortest: int = 0 if min_length is None else min_length
+    longest: int = sys.maxsize if max_length is None else max_length
+
+    # the messages for each rule that was given, looked up only when the input breaks them
+    reason_messages: dict[int, str] = {}
+    if min_length is not None:
+        reason_messages[_REASON_TOO_SMALL] = sys.intern(f'Must be {min_length} characters or more!')
+    if max_length is not None:
+        reason_messages[_REASON_TOO_LARGE] = sys.intern(f'Must be {max_length} characters or less!')
+
+    # each check pairs a test that returns True when the input breaks a rule with the reason bit for that rule
+    checks: list[tuple[Callable[[str], bool], int]] = []
+    if character_whitelist is not None:
+        if not isinstance(character_whitelist, str):
+            character_whitelist = ''.join(character_whitelist)
+        # a character class lets the regex engine scan the whole input in C (an empty class can't be compiled, so an empty whitelist only matches blank input)
+        whitelist_pattern: re.Pattern = re.compile(f'[{re.escape(character_whitelist)}]*' if character_whitelist else '')
+        checks.append((lambda user_input: whitelist_pattern.fullmatch(user_input) is None, _REASON_NOT_WHITELISTED))
+        reason_messages[_REASON_NOT_WHITELISTED] = sys.intern(f'Must only contain these characters: {character_whitelist}')
+    if character_blacklist is not None:
+        if not isinstance(character_blacklist, str):
+            character_blacklist = ''.join(character_blacklist)
+        blacklist_set: frozenset[str] = frozenset(character_blacklist)
+        checks.append((lambda user_input: not blacklist_set.isdisjoint(user_input), _REASON_BLACKLISTED))
+        reason_messages[_REASON_BLACKLISTED] = sys.intern(f'Cannot contain these characters: {character_blacklist}')
+
+    # cached for the length of this prompt, so retrying the same input doesn't validate it again
+    @functools.lru_cache(maxsize=8)
     def validator(user_input: str):
-        input_is_valid: bool = True
-        invalid_reasons: list[str] = []
-
-        if min_length is not None:
-            if len(user_input) < min_length:
-                input_is_valid = False
-                invalid_reasons.append(f'Must be {min_length} characters or more!')
-        if max_length is not None:
-            if len(user_input) > max_length:
-                input_is_valid = False
-                invalid_reasons.append(f'Must be {max_length} characters or less!')
-        if character_whitelist is not None:
-            conforms_to_whitelist: bool = True
-            for c in user_input:
-                if c not in character_whitelist:
-                    conforms_to_whitelist = False
+        invalid_reasons: int = 0
+
+        length: int = len(user_input)
+        # both bounds are checked on their own, so a min_length above max_length reports both messages
+        if length < shortest:
+            invalid_reasons |= _REASON_TOO_SMALL
+            if only_first_reason:
+                return invalid_reasons, user_input
+        if length > longest:
+            invalid_reasons |= _REASON_TOO_LARGE
+            if only_first_reason:
+                return invalid_reasons, user_input
+        for breaks_rule, reason in checks:
+            if breaks_rule(user_input):
+                invalid_reasons |= reason
+                if only_first_reason:
                     break
-            if not conforms_to_whitelist:
-                input_is_valid = False
-                invalid_reasons.append(f'Must only contain these characters: {"".join(character_whitelist)}')
-        if character_blacklist is not None:
-            conforms_to_blacklist: bool = True
-            for c in user_input:
-                if c in character_blacklist:
-                    conforms_to_blacklist = False
-                    break
-            if not conforms_to_blacklist:
-                input_is_valid = False
-                invalid_reasons.append(f'Cannot contain these characters: {"".join(character_blacklist)}')
 
-        return input_is_valid, invalid_reasons, user_input
+        return invalid_reasons, user_input
 
-    return _special_input(validator, prompt, end, fallback_if_blank, keep_asking_until_valid)
+    return _special_input(validator, reason_messages, prompt, end, fallback_if_blank, keep_asking_until_valid)
 
-def number_input(prompt: str | None = None, end: str = '\n', must_be_int: bool = False, min_value: float | None = None, max_value: float | None = None, whitelist: list[float] | None = None, blacklist: list[float] | None = None, fallback_if_blank: float | None = None, keep_asking_until_valid: bool = False) -> float | None:
+def number_input(prompt: str | None = None, end: str = '\n', must_be_int: bool = False, min_value: float | None = None, max_value: float | None = None, whitelist: list[float] | None = None, blacklist: list[float] | None = None, fallback_if_blank: float | None = None, keep_asking_until_valid: bool = False, only_first_reason: bool = False) -> float | None:
     """
     Prompts the user for a text input.
 
@@ -1005,56 +1207,90 @@ def number_input(prompt: str | None = None, end: str = '\n', must_be_int: bool =
     :type fallback_if_blank: float | None
     :param keep_asking_until_valid: Whether to keep asking the user repeatedly until a valid response is entered.
     :type keep_asking_until_valid: bool
+    :param only_first_reason: Whether to stop checking the input at the first rule it breaks, and only tell the user about that one.
+    :type only_first_reason: bool
     :return: The text inputted by the user (or None if the user entered an invalid value).
     :rtype: str | None
     """
-    def validator(user_input: str):
-        input_is_valid: bool = True
-        invalid_reasons: list[str] = []
-        user_input_number: float = 0
+    # missing limits become infinite bounds that can never be broken, so the bounds are compared inline
+    smallest: float = -math.inf if min_value is None else min_value
+    largest: float = math.inf if max_value is None else max_value
+
+    # the messages for each rule that was given, looked up only when the input breaks them
+    reason_messages: dict[int, str] = {_REASON_BAD_FORMAT: sys.intern('Invalid number format!'), _REASON_NOT_WHOLE: sys.intern('Must be a whole number!')}
+    if min_value is not None:
+        reason_messages[_REASON_TOO_SMALL] = sys.intern(f'Must be {min_value} or more!')
+    if max_value is not None:
+        reason_messages[_REASON_TOO_LARGE] = sys.intern(f'Must be {max_value} or less!')
+
+    # each check pairs a test that returns True when the number breaks a rule with the reason bit for that rule
+    checks: list[tuple[Callable[[float], bool], int]] = []
+    if whitelist is not None:
+        whitelist_set: frozenset[float] = frozenset(whitelist)
+        reason_messages[_REASON_NOT_WHITELISTED] = sys.intern(f'Must be one of these numbers: {", ".join(map(str, whitelist))}')
+        lowest: float = min(whitelist_set, default=0)
+        highest: float = max(whitelist_set, default=0)
+        if whitelist_set and all(type(n) is int for n in whitelist_set) and highest - lowest + 1 == len(whitelist_set):
+            # consecutive whole numbers are just a range, so two comparisons stand in for hashing the input
+            checks.append((lambda user_input_number: not (lowest <= user_input_number <= highest and user_input_number % 1 == 0), _REASON_NOT_WHITELISTED))
+        else:
+            checks.append((lambda user_input_number: user_input_number not in whitelist_set, _REASON_NOT_WHITELISTED))
+    if blacklist is not None:
+        blacklist_set: frozenset[float] = frozenset(blacklist)
+        checks.append((blacklist_set.__contains__, _REASON_BLACKLISTED))
+        reason_messages[_REASON_BLACKLISTED] = sys.intern(f'Cannot be any of these numbers: {", ".join(map(str, blacklist))}')
+
+    def check_number(user_input_number: float, invalid_reasons: int):
+        # both bounds are checked on their own, so a min_value above max_value reports both messages
+        if user_input_number < smallest:
+            invalid_reasons |= _REASON_TOO_SMALL
+            if only_first_reason:
+                return invalid_reasons, user_input_number
+        if user_input_number > largest:
+            invalid_reasons |= _REASON_TOO_LARGE
+            if only_first_reason:
+                return invalid_reasons, user_input_number
+        for breaks_rule, reason in checks:
+            if breaks_rule(user_input_number):
+                invalid_reasons |= reason
+                if only_first_reason:
+                    break
+
+        return invalid_reasons, user_input_number
 
+    def validate_float(user_input: str):
         try:
-            user_input_number = float(user_input)
+            user_input_number: float = float(user_input)
         except ValueError:
-            input_is_valid = False
-            invalid_reasons.append('Invalid number format!')
-        else:
-            if must_be_int:
-                if user_input_number != round(user_input_number):
-                    input_is_valid = False
-                    invalid_reasons.append('Must be a whole number!')
-                else:
-                    user_input_number = int(user_input_number)
-            if min_value is not None:
-                if user_input_number < min_value:
-                    input_is_valid = False
-                    invalid_reasons.append(f'Must be {min_value} or more!')
-            if max_value is not None:
-                if user_input_number > max_value:
-                    input_is_valid = False
-                    invalid_reasons.append(f'Must be {max_value} or less!')
-            if whitelist is not None:
-                conforms_to_whitelist: bool = False
-                for n in whitelist:
-                    if user_input_number == n:
-                        conforms_to_whitelist = True
-                        break
-                if not conforms_to_whitelist:
-                    input_is_valid = False
-                    invalid_reasons.append(f'Must be one of these numbers: {", ".join(str(n) for n in whitelist)}')
-            if blacklist is not None:
-                conforms_to_blacklist: bool = True
-                for n in blacklist:
-                    if user_input_number == n:
-                        conforms_to_blacklist = False
-                        break
-                if not conforms_to_blacklist:
-                    input_is_valid = False
-                    invalid_reasons.append(f'Cannot be any of these numbers: {", ".join(str(n) for n in blacklist)}')
-
-        return input_is_valid, invalid_reasons, user_input_number
-
-    return _special_input(validator, prompt, end, fallback_if_blank, keep_asking_until_valid)
+            return _REASON_BAD_FORMAT, 0
+
+        return check_number(user_input_number, 0)
+
+    def validate_int(user_input: str):
+        invalid_reasons: int = 0
+
+        # plain whole numbers go straight through int(), skipping the float conversion and rounding check
+        try:
+            user_input_number: float = int(user_input)
+        except ValueError: # inputs like '5.0' or '1e3' are still whole numbers, so let float() decide
+            try:
+                user_input_number = float(user_input)
+            except ValueError:
+                return _REASON_BAD_FORMAT, 0
+            if user_input_number != round(user_input_number):
+                invalid_reasons = _REASON_NOT_WHOLE
+                if only_first_reason:
+                    return invalid_reasons, user_input_number
+            else:
+                user_input_number = int(user_input_number)
+
+        return check_number(user_input_number, invalid_reasons)
+
+    # must_be_int can't change during the prompt, so the matching validator is picked once here
+    # (and cached for the length of this prompt, so retrying the same input doesn't validate it again)
+    validator: Callable[[str], tuple[int, float]] = functools.lru_cache(maxsize=8)(validate_int if must_be_int else validate_float)
+
+    return _special_input(validator, reason_messages, prompt, end, fallback_if_blank, keep_asking_until_valid)
 
 # ALIASES
 
@@ -1093,7 +1329,7 @@ def _main():
     name: str = text_input('What is your name?')
     print(f'Hello, {name}!')
     print()
-    username: str = text_input('Please enter a username between 3 and 20 characters.', min_length=3, max_length=20, keep_asking_until_valid=True, character_whitelist=['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j', 'k', 'l', 'm', 'n', 'o', 'p', 'q', 'r', 's', 't', 'u', 'v', 'w', 'x', 'y', 'z', 'A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L', 'M', 'N', 'O', 'P', 'Q', 'R', 'S', 'T', 'U', 'V', 'W', 'X', 'Y', 'Z', '0', '1', '2', '3', '4', '5', '6', '7', '8', '9', '_', '-'])
+    username: str = text_input('Please enter a username between 3 and 20 characters.', min_length=3, max_length=20, keep_asking_until_valid=True, character_whitelist=_USERNAME_CHARACTERS)
     print(f'Your username is: {username}')
     print()
     print('Test progress bar:')
@@ -0,0 +1,33 @@
+import contextlib
+import io
+import unittest
+from unittest import mock
+
+import soup_tui
+from soup_tui import format_number, text_input, number_input
+
+class FormatNumberTest(unittest.TestCase):
+    def test_negative_decimal_places_round_to_tens_and_hundreds(self):
+        self.assertEqual(format_number(1234, decimal_places=-2), '1,200')
+        self.assertEqual(format_number(1234.5, decimal_places=-2), '1,200')
+        self.assertEqual(format_number(-1234.5, decimal_places=-1), '-1,230')
+        self.assertEqual(format_number(99999.9, decimal_places=-2), '100,000')
+
+class TextInputTest(unittest.TestCase):
+    def test_min_length_above_max_length_shows_both_messages(self):
+        output: io.StringIO = io.StringIO()
+        with mock.patch.object(soup_tui, '_input', lambda prompt='': 'abcdefg'), contextlib.redirect_stdout(output):
+            self.assertIsNone(text_input(min_length=10, max_length=5))
+        self.assertIn('Must be 10 characters or more!', output.getvalue())
+        self.assertIn('Must be 5 characters or less!', output.getvalue())
+
+class NumberInputTest(unittest.TestCase):
+    def test_min_value_above_max_value_shows_both_messages(self):
+        output: io.StringIO = io.StringIO()
+        with mock.patch.object(soup_tui, '_input', lambda prompt='': '7'), contextlib.redirect_stdout(output):
+            self.assertIsNone(number_input(min_value=10, max_value=5))
+        self.assertIn('Must be 10 or more!', output.getvalue())
+        self.assertIn('Must be 5 or less!', output.getvalue())
+
+if __name__ == '__main__':
+    unittest.main()